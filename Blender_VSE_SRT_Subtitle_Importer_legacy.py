@@ -10,10 +10,12 @@ bl_info = {
 
 # import bpy for Blender Python API
 import bpy
-# import re from the Python standard library, for regular expressions
-import re
 # import os for file path handling
 import os
+# import chain and islice for reading subtitle entries in batches
+from itertools import chain, islice
+# import attrgetter and itemgetter for sorting strips and subtitles
+from operator import attrgetter, itemgetter
 # import props for custom properties
 from bpy.props import StringProperty, IntProperty, FloatProperty ,BoolProperty
 # import operators for custom operators
@@ -21,19 +23,177 @@ from bpy.types import Operator, Menu
 # import io_utils for custom import/export operators
 from bpy_extras.io_utils import ImportHelper, ExportHelper
 
+# Sequence editor cache settings, turned off during import
+_SEQ_CACHE_FLAGS = ('use_cache_raw', 'use_cache_preprocessed', 'use_cache_composite', 'use_cache_final')
+
+# Black shadow color for subtitle text
+_SHADOW_COLOR = (0.0, 0.0, 0.0, 1.0)
+# Y location (vertical position) of subtitle text, near the bottom
+_LOCATION_Y = 0.1
+
+# Parse one SRT block (list of non-blank lines) into a subtitle entry
+# Returns a tuple with the following items, or None if the block is malformed:
+# 1: index (Multiple digits)
+# 2: start time (HH:MM:SS,MMM)
+# 3: end time (HH:MM:SS,MMM)
+# 4: text (All remaining lines of the block, without trailing newline)
+def parse_srt_block(block):
+    if len(block) < 2 or not block[0].strip().isdigit():
+        return None
+    # Timecode line: start --> end, optionally followed by position coordinates (X1:... Y1:...)
+    start_time, arrow, end_time = block[1].partition('-->')
+    end_time = end_time.split(None, 1)
+    if not arrow or not end_time:
+        return None
+    return block[0].strip(), start_time.strip(), end_time[0], '\n'.join(block[2:])
+
+# Split SRT lines into subtitle entries
+# Accepts any iterable of lines (e.g. an open file), so large files are
+# parsed entry by entry instead of being read into memory at once
+def iter_srt_entries(lines):
+    # The last parsed entry is held back, as the following blocks may still be part of its text
+    pending = None
+    block = []
+    # A trailing blank line closes the last block
+    for line in chain(lines, ('',)):
+        line = line.rstrip('\r\n')
+        if line.strip():
+            block.append(line)
+            continue
+        if not block:
+            continue
+        # Entries are separated by blank lines
+        entry = parse_srt_block(block)
+        if entry:
+            if pending:
+                yield pending
+            pending = entry
+        elif pending and not block[0].strip().isdigit():
+            # Not starting with an index, so a blank line inside the subtitle text.
+            # Blocks with an index but a malformed timecode line are skipped.
+            pending = pending[:3] + (pending[3] + '\n\n' + '\n'.join(block),)
+        block = []
+    if pending:
+        yield pending
+
 # SRT time format: 00:00:00,000
 def parse_srt_time(time_str):
-    # Convert SRT time format to seconds
-    hours, minutes, seconds = time_str.replace(',', '.').split(':')
-    return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+    # Convert SRT time format to seconds (fixed width HH:MM:SS,MMM)
+    # Raises ValueError unless the layout matches and all nine digit positions hold ASCII digits.
+    # A '.' before the milliseconds is accepted as well, as some tools write HH:MM:SS.MMM
+    if len(time_str) != 12 or time_str[2] != ':' or time_str[5] != ':' or time_str[8] not in ',.':
+        raise ValueError(f"Invalid SRT time: {time_str!r}")
+    digits = time_str[0:2] + time_str[3:5] + time_str[6:8] + time_str[9:12]
+    if not (digits.isascii() and digits.isdigit()):
+        raise ValueError(f"Invalid SRT time: {time_str!r}")
+    return int(digits[0:2]) * 3600 + int(digits[2:4]) * 60 + int(digits[4:6]) + int(digits[6:9]) * 0.001
 
 def format_srt_time(seconds):
-    # Convert seconds to SRT time format
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    seconds = seconds % 60
-    milliseconds = int((seconds - int(seconds)) * 1000)
-    return f"{hours:02d}:{minutes:02d}:{int(seconds):02d},{milliseconds:03d}"
+    # Convert seconds to SRT time format, using whole milliseconds to avoid rounding errors
+    # Strips starting before frame 1 would give negative times, SRT cannot represent them
+    total_ms = max(0, int(round(seconds * 1000)))
+    hours, rest = divmod(total_ms, 3600000)
+    minutes, rest = divmod(rest, 60000)
+    seconds, milliseconds = divmod(rest, 1000)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d},{milliseconds:03d}"
+
+# Number of subtitle entries read and converted at once during import
+_BATCH_SIZE = 1000
+# Minimum number of timecodes converted with the JIT kernel (start and end of a full batch),
+# smaller conversions are not worth the kernel dispatch overhead
+_JIT_MIN_TIMECODES = 2 * _BATCH_SIZE
+
+# Convert a batch of SRT timecodes (N x 12 ASCII bytes) to frame numbers
+# Sets valid[i] to False for timecodes not in HH:MM:SS,MMM (or HH:MM:SS.MMM) layout,
+# the same check parse_srt_time() makes
+# Compiled with numba by get_jit_kernel(), plain Python otherwise
+def tc_to_frames(buf, fps, start_frame, out, valid):
+    for i in range(buf.shape[0]):
+        # 58 is ':', 44 is ',' and 46 is '.'
+        ok = buf[i, 2] == 58 and buf[i, 5] == 58 and (buf[i, 8] == 44 or buf[i, 8] == 46)
+        for j in (0, 1, 3, 4, 6, 7, 9, 10, 11):
+            if buf[i, j] < 48 or buf[i, j] > 57:
+                ok = False
+        valid[i] = ok
+        if not ok:
+            out[i] = 0
+            continue
+        hours = (buf[i, 0] - 48) * 10 + (buf[i, 1] - 48)
+        minutes = (buf[i, 3] - 48) * 10 + (buf[i, 4] - 48)
+        seconds = (buf[i, 6] - 48) * 10 + (buf[i, 7] - 48)
+        milliseconds = (buf[i, 9] - 48) * 100 + (buf[i, 10] - 48) * 10 + (buf[i, 11] - 48)
+        out[i] = int(start_frame + (hours * 3600 + minutes * 60 + seconds + milliseconds * 0.001) * fps)
+
+# numpy and numba are optional, they speed up timecode conversion for large files.
+# They are slow to import, so this only happens the first time a large batch is converted.
+# Holds (numpy, compiled kernel) once loaded, or False if they are not installed.
+_jit_kernel = None
+
+def get_jit_kernel():
+    global _jit_kernel
+    if _jit_kernel is None:
+        try:
+            import numpy
+            from numba import njit
+        except ImportError:
+            _jit_kernel = False
+        else:
+            # cache=True keeps the compiled kernel on disk between Blender sessions
+            _jit_kernel = (numpy, njit(cache=True)(tc_to_frames))
+    return _jit_kernel
+
+# The _srt_parse C extension is optional (see setup.py), it is used when it
+# has been built next to the add-on. Holds the module, or False if missing.
+_c_parser = None
+
+def get_c_parser():
+    global _c_parser
+    if _c_parser is None:
+        try:
+            import _srt_parse
+        except ImportError:
+            _c_parser = False
+        else:
+            _c_parser = _srt_parse
+    return _c_parser
+
+# Convert a list of SRT timecodes to frame numbers
+# Malformed timecodes are returned as None
+def srt_times_to_frames(times, fps, start_frame):
+    # The C extension handles batches of any size
+    c_parser = get_c_parser()
+    if c_parser:
+        return c_parser.times_to_frames(times, fps, start_frame)
+    
+    # Large batches of fixed width ASCII timecodes go through the JIT kernel
+    jit_kernel = len(times) >= _JIT_MIN_TIMECODES and get_jit_kernel()
+    # Every timecode must be 12 characters wide, or the rows of the matrix would shift.
+    # Non-ASCII characters become a single '?' byte, which the kernel never accepts.
+    if jit_kernel and all(len(time_str) == 12 for time_str in times):
+        data = ''.join(times).encode('ascii', 'replace')
+        np, kernel = jit_kernel
+        buf = np.frombuffer(data, dtype=np.uint8).reshape(-1, 12)
+        out = np.empty(len(times), dtype=np.int32)
+        valid = np.empty(len(times), dtype=np.bool_)
+        kernel(buf, fps, start_frame, out, valid)
+        return [frame if ok else None for frame, ok in zip(out.tolist(), valid.tolist())]
+    
+    parse_time = parse_srt_time
+    frames = []
+    for time_str in times:
+        try:
+            frames.append(int(start_frame + parse_time(time_str) * fps))
+        except ValueError:
+            frames.append(None)
+    return frames
+
+# Number of subtitle entries joined into a single write during export
+_EXPORT_CHUNK_SIZE = 10000
+
+# Highest channel available in the sequencer
+_MAX_CHANNEL = 32
+# Number of channels used when spreading subtitles over channels
+_SPREAD_CHANNELS = 4
 
 # Get scene FPS
 def get_scene_fps(scene):
@@ -45,6 +205,8 @@ class SEQUENCER_OT_ImportSRT(Operator, ImportHelper):
     bl_idname = "sequencer.import_srt"
     bl_label = "Import SRT"
     bl_description = "Import subtitles from SRT file"
+    # Register the whole import as a single undo step
+    bl_options = {'REGISTER', 'UNDO'}
     
     filename_ext = ".srt"
     filter_glob: StringProperty(default="*.srt", options={'HIDDEN'})
@@ -60,7 +222,19 @@ class SEQUENCER_OT_ImportSRT(Operator, ImportHelper):
         description="Channel to place subtitles",
         default=1,
         min=1,
-        max=32
+        max=_MAX_CHANNEL
+    )
+    
+    spread_channels: BoolProperty(
+        name="Spread Channels",
+        description="Place subtitles on consecutive channels in turn, starting at the subtitle channel. Faster for very large files",
+        default=False
+    )
+    
+    skip_styling: BoolProperty(
+        name="Skip Styling",
+        description="Keep Blender's default text style instead of setting font size, position, shadow and alignment. Faster for very large files",
+        default=False
     )
     
     use_scene_fps: BoolProperty(
@@ -81,6 +255,8 @@ class SEQUENCER_OT_ImportSRT(Operator, ImportHelper):
         
         layout.prop(self, "start_frame")
         layout.prop(self, "subtitle_channel")
+        layout.prop(self, "spread_channels")
+        layout.prop(self, "skip_styling")
         layout.prop(self, "use_scene_fps")
         
         # Only show custom FPS option if use_scene_fps is off
@@ -92,6 +268,9 @@ class SEQUENCER_OT_ImportSRT(Operator, ImportHelper):
             layout.label(text=f"Current Scene FPS: {fps:.3f}")
     
     def execute(self, context):
+        # Get file name
+        filename = os.path.basename(self.filepath)
+        
         try:
             # Determine which FPS to use
             if self.use_scene_fps:
@@ -99,23 +278,6 @@ class SEQUENCER_OT_ImportSRT(Operator, ImportHelper):
             else:
                 fps = self.custom_fps
             
-            # Open and read the SRT file
-            with open(self.filepath, 'r', encoding='utf-8-sig') as file:
-                content = file.read()
-            
-            # Regular expression to parse SRT file
-            # Matches each subtitle entry, with the following groups:
-            # 1: index (Multiple digits)
-            # 2: start time (HH:MM:SS,MMM)
-            # 3: end time (HH:MM:SS,MMM)
-            # 4: text (Texts until [a digits with a newline] or [EOF])
-            pattern = r'(\d+)\n(\d{2}:\d{2}:\d{2},\d{3}) --> (\d{2}:\d{2}:\d{2},\d{3})\n([\s\S]*?)(?=\n\n\d+\n|$)'
-            matches = re.findall(pattern, content)
-            
-            if not matches:
-                self.report({'ERROR'}, "No subtitles found in the SRT file")
-                return {'CANCELLED'}
-            
             # Get the current sequence editor
             scene = context.scene
             if not scene.sequence_editor:
@@ -123,47 +285,90 @@ class SEQUENCER_OT_ImportSRT(Operator, ImportHelper):
             
             seq_editor = scene.sequence_editor
             
-            # Add each subtitle as a text strip
-            for index, start_time, end_time, text in matches:
-                # Convert times to seconds
-                start_sec = parse_srt_time(start_time)
-                end_sec = parse_srt_time(end_time)
-                
-                # Convert seconds to frames
-                start_frame = int(self.start_frame + start_sec * fps)
-                end_frame = int(self.start_frame + end_sec * fps)
-                duration = end_frame - start_frame
-                
-                # Clean up text (remove extra newlines at end)
-                text = text.strip()
-                
-                # Create text strip
-                text_strip = seq_editor.sequences.new_effect(
-                    name=f"Subtitle {index}",
-                    type='TEXT',
-                    channel=self.subtitle_channel,
-                    frame_start=start_frame,
-                    frame_end=start_frame + duration
-                )
-                
-                # Set text properties
-                text_strip.text = text
-                text_strip.font_size = 24
-                
-                # Position at bottom center
-                text_strip.location[1] = 0.1  # Y location (vertical position)
-                text_strip.use_shadow = True
-                text_strip.shadow_color = (0, 0, 0, 1)  # Black shadow
-                text_strip.blend_type = 'ALPHA_OVER'
-                
-                # TextSequence doesn't have align_x, but we can set alignment in Blender ≥ 2.8
-                # with the 'text_align' property if it exists
-                if hasattr(text_strip, 'text_align'):
-                    text_strip.text_align = 'CENTER'
+            # Bind values used in the loop to locals, to avoid repeated attribute lookups
+            new_effect = seq_editor.sequences.new_effect
+            base_frame = self.start_frame
+            channel = self.subtitle_channel
+            skip_styling = self.skip_styling
+            fps = float(fps)
             
-            # Get file name
-            filename = os.path.basename(self.filepath)
-            self.report({'INFO'}, f"Success. From [{filename}] there are [{len(matches)}] subtitles imported using FPS: [{fps:.3f}]")
+            # Number of channels subtitles are spread over, limited by the last channel
+            spread = min(_SPREAD_CHANNELS, _MAX_CHANNEL - channel + 1) if self.spread_channels else 1
+            
+            # TextSequence doesn't have align_x, but we can set alignment in Blender ≥ 2.8
+            # with the 'text_align' property if it exists. Checked once for all strips,
+            # newer Blender versions may not have a TextSequence type at all.
+            text_type = getattr(bpy.types, 'TextSequence', None)
+            has_text_align = text_type is not None and 'text_align' in text_type.bl_rna.properties
+            
+            # Disable the sequencer cache while strips are added, so it is not
+            # invalidated for every new strip. Restored once the import is done.
+            # Flags missing in the running Blender version are left alone.
+            cache_flags = {flag: getattr(seq_editor, flag) for flag in _SEQ_CACHE_FLAGS if hasattr(seq_editor, flag)}
+            for flag in cache_flags:
+                setattr(seq_editor, flag, False)
+            
+            try:
+                # Open the SRT file with a large read buffer, it is read
+                # entry by entry while the strips are created. Iterating text lines is
+                # as fast as reading the raw bytes and decoding them at once, without
+                # holding the whole file in memory.
+                with open(self.filepath, 'r', encoding='utf-8-sig', buffering=1 << 20) as file:
+                    # Add each subtitle as a text strip
+                    count = 0
+                    entries = iter_srt_entries(file)
+                    while True:
+                        batch = list(islice(entries, _BATCH_SIZE))
+                        if not batch:
+                            break
+                        
+                        # Convert start and end times of the whole batch to frames
+                        frames = srt_times_to_frames([entry[1] for entry in batch] + [entry[2] for entry in batch], fps, base_frame)
+                        
+                        # Skip entries with malformed timecodes, and sort by start frame so
+                        # each new strip is appended after the existing ones in its channel
+                        subtitles = [
+                            (start_frame, end_frame, index, text)
+                            for (index, _, _, text), start_frame, end_frame in zip(batch, frames, frames[len(batch):])
+                            if start_frame is not None and end_frame is not None
+                        ]
+                        subtitles.sort(key=itemgetter(0))
+                        
+                        for start_frame, end_frame, index, text in subtitles:
+                            # Create text strip
+                            text_strip = new_effect(
+                                name="Subtitle " + index,
+                                type='TEXT',
+                                channel=channel + count % spread,
+                                frame_start=start_frame,
+                                frame_end=end_frame
+                            )
+                            
+                            # Set text properties
+                            text_strip.text = text
+                            text_strip.blend_type = 'ALPHA_OVER'
+                            
+                            if not skip_styling:
+                                text_strip.font_size = 24
+                                
+                                # Position at bottom center
+                                text_strip.location[1] = _LOCATION_Y
+                                text_strip.use_shadow = True
+                                text_strip.shadow_color = _SHADOW_COLOR
+                                
+                                if has_text_align:
+                                    text_strip.text_align = 'CENTER'
+                            
+                            count += 1
+            finally:
+                for flag, value in cache_flags.items():
+                    setattr(seq_editor, flag, value)
+            
+            if not count:
+                self.report({'ERROR'}, f"No subtitles found in [{filename}]")
+                return {'CANCELLED'}
+            
+            self.report({'INFO'}, f"Success. From [{filename}] there are [{count}] subtitles imported using FPS: [{fps:.3f}]")
             return {'FINISHED'}
             
         except Exception as e:
@@ -216,19 +421,20 @@ class SEQUENCER_OT_ExportSRT(Operator, ExportHelper):
         else:
             fps = self.custom_fps
         
-        # Get selected text strips
-        selected_strips = [strip for strip in context.selected_sequences if strip.type == 'TEXT']
+        # Get selected text strips, sorted by start frame
+        selected_strips = sorted(
+            (strip for strip in context.selected_sequences if strip.type == 'TEXT'),
+            key=attrgetter('frame_start')
+        )
         
         if not selected_strips:
             self.report({'ERROR'}, "No text strips selected")
             return {'CANCELLED'}
         
-        # Sort strips by start frame
-        selected_strips.sort(key=lambda strip: strip.frame_start)
-        
         # Write SRT file
         try:
-            with open(self.filepath, 'w', encoding='utf-8') as file:
+            with open(self.filepath, 'w', encoding='utf-8', buffering=1 << 20) as file:
+                parts = []
                 for i, strip in enumerate(selected_strips, 1):
                     # Calculate start and end times in SRT format
                     start_sec = (strip.frame_start - 1) / fps
@@ -237,10 +443,13 @@ class SEQUENCER_OT_ExportSRT(Operator, ExportHelper):
                     start_time = format_srt_time(start_sec)
                     end_time = format_srt_time(end_sec)
                     
-                    # Write subtitle entry
-                    file.write(f"{i}\n")
-                    file.write(f"{start_time} --> {end_time}\n")
-                    file.write(f"{strip.text}\n\n")
+                    # Collect subtitle entry, written in chunks to limit memory use
+                    parts.append(f"{i}\n{start_time} --> {end_time}\n{strip.text}\n\n")
+                    if len(parts) >= _EXPORT_CHUNK_SIZE:
+                        file.write(''.join(parts))
+                        parts.clear()
+                
+                file.write(''.join(parts))
             
             # Get file name
             filename = os.path.basename(self.filepath)
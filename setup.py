@@ -0,0 +1,10 @@
+# Builds the optional C accelerator next to the add-on:
+#     python setup.py build_ext --inplace
+# Copy the resulting _srt_parse*.so / .pyd into the same add-ons folder as
+# Blender_VSE_SRT_Subtitle_Importer_legacy.py
+from setuptools import setup, Extension
+
+setup(
+    name="srt_parse",
+    ext_modules=[Extension("_srt_parse", ["_srt_parse.c"], py_limited_api=True)],
+)
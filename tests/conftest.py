@@ -0,0 +1,33 @@
+# Shared test setup: makes the add-on importable from the repository root
+import os
+import sys
+import types
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Outside Blender, provide the names the add-on imports at load time.
+# The parsing and timecode functions under test do not use them.
+try:
+    import bpy  # noqa: F401
+except ImportError:
+    def _property(**kwargs):
+        return kwargs.get('default')
+
+    bpy = types.ModuleType('bpy')
+    bpy.props = types.ModuleType('bpy.props')
+    bpy.props.StringProperty = bpy.props.IntProperty = _property
+    bpy.props.FloatProperty = bpy.props.BoolProperty = _property
+    bpy.types = types.ModuleType('bpy.types')
+    bpy.types.Operator = type('Operator', (), {})
+    bpy.types.Menu = type('Menu', (), {})
+    bpy_extras = types.ModuleType('bpy_extras')
+    bpy_extras.io_utils = types.ModuleType('bpy_extras.io_utils')
+    bpy_extras.io_utils.ImportHelper = type('ImportHelper', (), {})
+    bpy_extras.io_utils.ExportHelper = type('ExportHelper', (), {})
+    sys.modules.update({
+        'bpy': bpy,
+        'bpy.props': bpy.props,
+        'bpy.types': bpy.types,
+        'bpy_extras': bpy_extras,
+        'bpy_extras.io_utils': bpy_extras.io_utils,
+    })
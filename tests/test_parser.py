@@ -0,0 +1,31 @@
+# Splitting SRT content into subtitle entries
+import io
+
+import Blender_VSE_SRT_Subtitle_Importer_legacy as addon
+
+
+def entries(content):
+    return list(addon.iter_srt_entries(io.StringIO(content)))
+
+
+def test_blank_line_inside_text_is_kept():
+    content = (
+        "1\n00:00:01,000 --> 00:00:02,000\nHello\n\nsecond para\n\n"
+        "2\n00:00:03,000 --> 00:00:04,000\nNext\n"
+    )
+    assert entries(content) == [
+        ('1', '00:00:01,000', '00:00:02,000', 'Hello\n\nsecond para'),
+        ('2', '00:00:03,000', '00:00:04,000', 'Next'),
+    ]
+
+
+def test_entry_with_malformed_timecode_line_is_skipped():
+    content = (
+        "1\n00:00:01,000 --> 00:00:02,000\nHello\n\n"
+        "2\n00:00:05,000 -->\nGarbage\n\n"
+        "3\n00:00:07,000 --> 00:00:08,000\nThird\n"
+    )
+    assert entries(content) == [
+        ('1', '00:00:01,000', '00:00:02,000', 'Hello'),
+        ('3', '00:00:07,000', '00:00:08,000', 'Third'),
+    ]
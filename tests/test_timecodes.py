@@ -0,0 +1,87 @@
+# Parity of the timecode conversion backends: pure Python, numba and the C extension
+# Run from the repository root with: python -m pytest tests
+import pytest
+
+import Blender_VSE_SRT_Subtitle_Importer_legacy as addon
+
+# '.' before the milliseconds is accepted on purpose, some tools write HH:MM:SS.MMM
+VALID = ['00:00:00,000', '00:00:01,000', '01:02:03,456', '99:59:59,999', '00:00:01.500']
+MALFORMED = [
+    '',
+    '00:00:01',
+    '00:00:01,5',
+    '00:00:01,50',
+    '00:00:01,5000',
+    '-1:00:00,000',
+    ' 0:00:01,000',
+    '+0:00:01,000',
+    '00:0a:01,000',
+    '00:00:01,00é',
+    '٠٠:00:01,000',
+    '00x00y01z500',
+    '00:00:01;500',
+    '00.00.01,500',
+    '00:00,01:500',
+]
+
+
+@pytest.fixture
+def backend(request, monkeypatch):
+    # Force srt_times_to_frames() onto a single backend
+    if request.param == 'python':
+        monkeypatch.setattr(addon, '_c_parser', False)
+        monkeypatch.setattr(addon, '_jit_kernel', False)
+    elif request.param == 'numba':
+        pytest.importorskip('numba')
+        monkeypatch.setattr(addon, '_c_parser', False)
+        monkeypatch.setattr(addon, '_jit_kernel', None)
+    elif request.param == 'c':
+        c_parser = pytest.importorskip('_srt_parse')
+        monkeypatch.setattr(addon, '_c_parser', c_parser)
+    return request.param
+
+
+def python_frames(times, fps, start_frame):
+    frames = []
+    for time_str in times:
+        try:
+            frames.append(int(start_frame + addon.parse_srt_time(time_str) * fps))
+        except ValueError:
+            frames.append(None)
+    return frames
+
+
+@pytest.mark.parametrize('time_str', MALFORMED)
+def test_parse_srt_time_rejects_malformed(time_str):
+    with pytest.raises(ValueError):
+        addon.parse_srt_time(time_str)
+
+
+@pytest.mark.parametrize('backend', ['python', 'numba', 'c'], indirect=True)
+@pytest.mark.parametrize('fps', [24.0, 25.0, 30000 / 1001, 59.94])
+@pytest.mark.parametrize('start_frame', [1, -50, 100000])
+def test_backends_match_python(backend, fps, start_frame):
+    # Pad to a full batch, so the numba kernel is used instead of the Python fallback
+    times = VALID + MALFORMED
+    times += VALID * (addon._JIT_MIN_TIMECODES // len(VALID) + 1)
+    frames = addon.srt_times_to_frames(times, fps, start_frame)
+    assert frames == python_frames(times, fps, start_frame)
+    assert frames[len(VALID):len(VALID) + len(MALFORMED)] == [None] * len(MALFORMED)
+
+
+@pytest.mark.parametrize('backend', ['python', 'numba', 'c'], indirect=True)
+def test_backends_reject_fixed_width_malformed(backend):
+    # All 12 characters wide, so the numba kernel itself checks them
+    malformed = [time_str for time_str in MALFORMED if len(time_str) == 12]
+    times = malformed * (addon._JIT_MIN_TIMECODES // len(malformed) + 1)
+    assert addon.srt_times_to_frames(times, 24.0, 1) == [None] * len(times)
+
+
+@pytest.mark.parametrize('backend', ['python', 'numba', 'c'], indirect=True)
+def test_backends_reject_compensating_widths(backend):
+    # 11 + 13 characters add up to two 12 character rows, which must not be packed as such
+    times = ['00:00:01,00', '00:00:01,0000']
+    times += VALID * (addon._JIT_MIN_TIMECODES // len(VALID) + 1)
+    frames = addon.srt_times_to_frames(times, 24.0, 1)
+    assert frames[:2] == [None, None]
+    assert frames == python_frames(times, 24.0, 1)